@@ -4,19 +4,25 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from xrpd_parser.value import Value
+from xrpd_parser.utils import ParsingError
+from xrpd_parser.value import make_value
 
 
+# single-token groups instead of greedy '.+' wildcards so that the engine never backtracks
+# across the whole line; multi-token values (e.g. fractions) are handled by the tokenizer
 ATOM_REGEX = re.compile(
     r"site\s+(\S+)\s+"
     r"num_posns\s+(\d+)\s+"
-    r"x\s+(.+)\s+"
-    r"y\s+(.+)\s+"
-    r"z\s+(.+)\s+"
-    r"occ\s+([\w\+\-]+)\s+(.+)\s+"
-    r"beq\s+(([\w\+\-\=]+)(; :)?\s+)?(\d.*)"
+    r"x\s+(\S+)\s+"
+    r"y\s+(\S+)\s+"
+    r"z\s+(\S+)\s+"
+    r"occ\s+([\w\+\-]+)\s+(\S+)\s+"
+    r"beq\s+(?:([\w\+\-\=]+)(?:; :)?\s+)?(\d\S*)"
 )
 
+# keywords that structure an atom line, in the order they are expected to appear
+ATOM_KEYWORDS = ("site", "num_posns", "x", "y", "z", "occ", "beq")
+
 
 class Atom:
     """Class for atoms in measured structures."""
@@ -28,6 +34,21 @@ class Atom:
             site_str: The string to be parsed.
         """
         self._parse(site_str)
+
+    @classmethod
+    def _from_match(cls, match: re.Match) -> Atom:
+        """Create an atom from an already-computed ATOM_REGEX match.
+
+        Args:
+            match: A match object holding the groups of ATOM_REGEX.
+
+        Returns:
+            The new atom instance.
+        """
+        atom = cls.__new__(cls)
+        atom._set_from_match(match)
+
+        return atom
     
     def __str__(self):
         """Return a string representation of the atom.
@@ -75,23 +96,97 @@ class Atom:
     def _parse(self, site_str: str) -> None:
         """Parse an atom string (line starting with 'site') and set the attributes of the instance.
 
+        The line is tokenized and read keyword by keyword, which avoids running the backtracking
+        ATOM_REGEX per atom; the regex is kept as a fallback for lines the tokenizer cannot handle.
+
         Args:
             site_str: The string to be parsed.
 
         Raises:
-            ParsingError: If the parsing was not successful.
+            ValueError: If the parsing was not successful.
+        """
+        try:
+            self._parse_tokens(site_str)
+        except (KeyError, IndexError, ValueError, ParsingError):
+            self._parse_regex(site_str)
+
+    def _parse_tokens(self, site_str: str) -> None:
+        """Parse an atom string via a single tokenization pass over the keyword-delimited format.
+
+        Args:
+            site_str: The string to be parsed.
+
+        Raises:
+            KeyError: If one of the expected keywords is missing.
+            IndexError: If a keyword is not followed by the expected tokens.
+            ValueError: If the keywords do not appear in the expected order or a token could not
+                be converted.
+            ParsingError: If one of the sliced value strings could not be parsed.
+        """
+        tokens = site_str.split()
+
+        keyword_positions = {}
+        for i, token in enumerate(tokens):
+            if token in ATOM_KEYWORDS and token not in keyword_positions:
+                keyword_positions[token] = i
+
+        positions = [keyword_positions[keyword] for keyword in ATOM_KEYWORDS]
+        if positions != sorted(positions):
+            raise ValueError(f"atom keywords out of order in line {site_str}")
+
+        self.name = tokens[positions[0] + 1]
+        self.multiplicity = int(tokens[positions[1] + 1])
+        self.x_value = make_value(" ".join(tokens[positions[2] + 1:positions[3]]))
+        self.y_value = make_value(" ".join(tokens[positions[3] + 1:positions[4]]))
+        self.z_value = make_value(" ".join(tokens[positions[4] + 1:positions[5]]))
+
+        occ_tokens = tokens[positions[5] + 1:positions[6]]
+        self.occ_label = occ_tokens[0]
+        self.occ = make_value(" ".join(occ_tokens[1:]))
+
+        beq_tokens = tokens[positions[6] + 1:]
+        if beq_tokens[0][0].isdigit():
+            self.beq_label = None
+        else:
+            self.beq_label = beq_tokens[0].rstrip(";")
+            beq_tokens = beq_tokens[1:]
+            if beq_tokens and beq_tokens[0] == ":":
+                beq_tokens = beq_tokens[1:]
+        self.beq = make_value(" ".join(beq_tokens))
+
+        # force the parse of the sliced value strings so that mis-tokenized lines raise here
+        # and reach the regex fallback instead of failing on first attribute access much later
+        for value in (self.x_value, self.y_value, self.z_value, self.occ, self.beq):
+            value.value
+
+    def _parse_regex(self, site_str: str) -> None:
+        """Parse an atom string with ATOM_REGEX (fallback for the tokenization pass).
+
+        Args:
+            site_str: The string to be parsed.
+
+        Raises:
+            ValueError: If the parsing was not successful.
         """
         match = ATOM_REGEX.match(site_str)
-        
+
         if not match:
             raise ValueError(f"Could not parse atom line {site_str}")
-        
+
+        self._set_from_match(match)
+
+    def _set_from_match(self, match: re.Match) -> None:
+        """Set the attributes of the instance from an ATOM_REGEX match.
+
+        Args:
+            match: A match object holding the groups of ATOM_REGEX.
+        """
         self.name = match.group(1)
         self.multiplicity = int(match.group(2))
-        self.x_value = Value(match.group(3))
-        self.y_value = Value(match.group(4))
-        self.z_value = Value(match.group(5))
+        self.x_value = make_value(match.group(3))
+        self.y_value = make_value(match.group(4))
+        self.z_value = make_value(match.group(5))
         self.occ_label = match.group(6)
-        self.occ = Value(match.group(7))
-        self.beq_label = match.group(9)
-        self.beq = Value(match.group(11))
+        self.occ = make_value(match.group(7))
+        self.beq_label = match.group(8)
+        self.beq = make_value(match.group(9))
@@ -2,38 +2,154 @@
 from __future__ import annotations
 
 import argparse
-from collections import deque
+import csv
 from pathlib import Path
+from typing import Any
+from typing import Iterable
+from typing import Iterator
 
+import numpy as np
 import pandas as pd
 
 from xrpd_parser.measurement import Measurement
+from xrpd_parser.measurement import TEMPERATURE_REGEX
+from xrpd_parser.measurement import XDD_REGEX
+from xrpd_parser.structure import Structure
+from xrpd_parser.utils import LineCursor
 from xrpd_parser.viz import plot_parameters
 
 
+# columns of the atoms table that are filled from the Atom attributes (in output order)
+ATOM_COLUMNS = (
+    "name",
+    "multiplicity",
+    "x",
+    "x_err",
+    "x_fitted",
+    "y",
+    "y_err",
+    "y_fitted",
+    "z",
+    "z_err",
+    "z_fitted",
+    "occ_label",
+    "occ",
+    "beq_label",
+    "beq",
+    "beq_err",
+)
+
+# known dtypes of the output columns so that pandas does not have to infer them; columns not
+# listed here hold strings (or None) and are stored with dtype 'object'
+STRUCTURE_COLUMN_DTYPES: dict[str, type] = {
+    "measurement_id": np.int64,
+    "temperature": np.float64,
+}
+
+# column index per numeric structure parameter in the matrix filled via Structure.fill_row
+STRUCTURE_PARAM_INDICES: dict[str, int] = {}
+for _p, _has_error in Structure.PARAM2HAS_ERROR.items():
+    STRUCTURE_PARAM_INDICES[_p] = len(STRUCTURE_PARAM_INDICES)
+    if _has_error:
+        STRUCTURE_PARAM_INDICES[f"{_p}_err"] = len(STRUCTURE_PARAM_INDICES)
+
+ATOM_COLUMN_DTYPES: dict[str, type] = {
+    "measurement_id": np.int64,
+    "temperature": np.float64,
+    "multiplicity": np.int64,
+    "x": np.float64,
+    "x_err": np.float64,
+    "x_fitted": np.bool_,
+    "y": np.float64,
+    "y_err": np.float64,
+    "y_fitted": np.bool_,
+    "z": np.float64,
+    "z_err": np.float64,
+    "z_fitted": np.bool_,
+    "occ": np.float64,
+    "beq": np.float64,
+    "beq_err": np.float64,
+}
+
+
+def _preallocate_columns(
+    names: Iterable[str],
+    dtypes: dict[str, type],
+    n: int,
+) -> dict[str, np.ndarray]:
+    """Preallocate one numpy array of known length and dtype per output column.
+
+    Args:
+        names: The names of the output columns.
+        dtypes: The dtype per column; columns without an entry become 'object' arrays.
+        n: The number of rows.
+
+    Returns:
+        One uninitialized numpy array per output column.
+    """
+    return {name: np.empty(n, dtype=dtypes.get(name, object)) for name in names}
+
+
+def _parse_lines(line_queue: LineCursor) -> list[Measurement]:
+    """Parse all measurements from a cursor over the lines of a TOPAS output file.
+
+    Args:
+        line_queue: The cursor over the lines to be parsed.
+
+    Returns:
+        A list of measurement objects (with their 'xdd' calling lines not yet decoded).
+    """
+    measurements = []
+
+    while (line := line_queue.pop()) is not None:
+        if line.startswith("xdd"):
+            measurements.append(Measurement._from_calling_line(line, line_queue))
+
+    return measurements
+
+
 def parse_file(filepath: str | Path) -> list[Measurement]:
     """Parse a TOPAS output file.
 
+    The file is streamed through a LineCursor, so only the current line (and one line of
+    lookahead) is held as raw text at any time.
+
     Args:
         filepath: Path to the file.
 
     Returns:
         A list of measurement objects.
-    """    
-    measurements = []
-    
+    """
     try:
         with open(filepath, "r") as f:
-            line_queue = deque(f.readlines())
+            measurements = _parse_lines(LineCursor(f))
     except UnicodeDecodeError:
         with open(filepath, "r", encoding="latin-1") as f:
-            line_queue = deque(f.readlines())
-    
-    while line_queue:
-        line = line_queue.popleft()
-        if line.startswith("xdd"):
-            measurements.append(Measurement(line, line_queue))
-    
+            measurements = _parse_lines(LineCursor(f))
+
+    # decode all 'xdd' calling lines at once with the vectorized pandas string kernels instead of
+    # running the regexes once per measurement
+    if measurements:
+        calling_lines = pd.Series([m.calling_line for m in measurements])
+
+        xy_file_paths = calling_lines.str.extract(XDD_REGEX, expand=False)
+        if xy_file_paths.isna().any():
+            bad_line = calling_lines[xy_file_paths.isna()].iloc[0]
+            raise ValueError(f"Could not parse .xy filename from {bad_line}")
+
+        temperatures = xy_file_paths.str.extract(TEMPERATURE_REGEX, expand=False)
+        if temperatures.isna().any():
+            bad_path = xy_file_paths[temperatures.isna()].iloc[0]
+            raise ValueError(
+                f"Could not parse temperature from {bad_path}, expected filename to end with "
+                "something like '_0024-0_C.xy' (which would return 24.0 for 24 degrees Celcius)"
+            )
+
+        for measurement, xy_file_path, temperature in zip(
+            measurements, xy_file_paths, temperatures.astype(float)
+        ):
+            measurement._set_from_parsed(xy_file_path, temperature)
+
     return measurements
 
 def to_dataframes(measurements: list[Measurement]) -> tuple[pd.DataFrame, pd.DataFrame]:
@@ -47,32 +163,147 @@ def to_dataframes(measurements: list[Measurement]) -> tuple[pd.DataFrame, pd.Dat
         atom. The columns 'measurement_id' and 'phase_name' can be used as foreign key in the atoms
         table.
     """    
-    data_structures = []
-    data_atoms = []
-    
+    # the row counts are known up front, so every output column can be preallocated at its
+    # final size and written by index instead of growing list by list
+    n_structures = sum(len(measurement.structures) for measurement in measurements)
+    n_atoms = sum(
+        len(structure.atoms)
+        for measurement in measurements
+        for structure in measurement.structures.values()
+    )
+
+    structure_columns = _preallocate_columns(
+        ("measurement_id", "file_name", "temperature", "phase_name"),
+        STRUCTURE_COLUMN_DTYPES,
+        n_structures,
+    )
+    # the numeric structure parameters go into one contiguous float matrix, one row per
+    # structure, that is sliced into columns afterwards
+    structure_params = np.full((n_structures, len(STRUCTURE_PARAM_INDICES)), np.nan)
+    atom_columns = _preallocate_columns(
+        ("measurement_id", "temperature", "phase_name") + ATOM_COLUMNS,
+        ATOM_COLUMN_DTYPES,
+        n_atoms,
+    )
+
+    structure_idx = 0
+    atom_idx = 0
+
+    for measurement_id, measurement in enumerate(measurements):
+        for phase_name, structure in measurement.structures.items():
+            structure_columns["measurement_id"][structure_idx] = measurement_id
+            structure_columns["file_name"][structure_idx] = measurement.xy_file_path
+            structure_columns["temperature"][structure_idx] = measurement.temperature
+            structure_columns["phase_name"][structure_idx] = phase_name
+
+            structure.fill_row(structure_params[structure_idx], STRUCTURE_PARAM_INDICES)
+
+            structure_idx += 1
+
+            for atom in structure.atoms:
+                atom_columns["measurement_id"][atom_idx] = measurement_id
+                atom_columns["temperature"][atom_idx] = measurement.temperature
+                atom_columns["phase_name"][atom_idx] = phase_name
+
+                atom_columns["name"][atom_idx] = atom.name
+                atom_columns["multiplicity"][atom_idx] = atom.multiplicity
+
+                atom_columns["x"][atom_idx] = atom.x_value.value
+                atom_columns["x_err"][atom_idx] = atom.x_value.error
+                atom_columns["x_fitted"][atom_idx] = atom.x_value.has_been_fitted
+
+                atom_columns["y"][atom_idx] = atom.y_value.value
+                atom_columns["y_err"][atom_idx] = atom.y_value.error
+                atom_columns["y_fitted"][atom_idx] = atom.y_value.has_been_fitted
+
+                atom_columns["z"][atom_idx] = atom.z_value.value
+                atom_columns["z_err"][atom_idx] = atom.z_value.error
+                atom_columns["z_fitted"][atom_idx] = atom.z_value.has_been_fitted
+
+                atom_columns["occ_label"][atom_idx] = atom.occ_label
+                atom_columns["occ"][atom_idx] = atom.occ.value
+
+                atom_columns["beq_label"][atom_idx] = atom.beq_label
+                atom_columns["beq"][atom_idx] = atom.beq.value
+                atom_columns["beq_err"][atom_idx] = atom.beq.error
+
+                atom_idx += 1
+
+    for name, column_idx in STRUCTURE_PARAM_INDICES.items():
+        structure_columns[name] = structure_params[:, column_idx]
+
+    return pd.DataFrame(structure_columns), pd.DataFrame(atom_columns)
+
+
+def iter_structure_rows(measurements: list[Measurement]) -> Iterator[dict[str, Any]]:
+    """Yield one dictionary per structure of the given measurements.
+
+    Args:
+        measurements: A list of measurement objects.
+
+    Yields:
+        One dictionary per structure, with the same keys as the columns of the structures
+        dataframe returned by to_dataframes.
+    """
+    for measurement_id, measurement in enumerate(measurements):
+        for phase_name, structure in measurement.structures.items():
+            yield {
+                "measurement_id": measurement_id,
+                "file_name": measurement.xy_file_path,
+                "temperature": measurement.temperature,
+                "phase_name": phase_name,
+                **structure.to_dict(),
+            }
+
+
+def iter_atom_rows(measurements: list[Measurement]) -> Iterator[dict[str, Any]]:
+    """Yield one dictionary per atom of the given measurements.
+
+    Args:
+        measurements: A list of measurement objects.
+
+    Yields:
+        One dictionary per atom, with the same keys as the columns of the atoms dataframe
+        returned by to_dataframes.
+    """
     for measurement_id, measurement in enumerate(measurements):
         for phase_name, structure in measurement.structures.items():
-            data_structures.append(
-                {
+            for atom in structure.atoms:
+                yield {
                     "measurement_id": measurement_id,
-                    "file_name": measurement.xy_file_path,
                     "temperature": measurement.temperature,
                     "phase_name": phase_name,
-                    **structure.to_dict()
+                    **atom.to_dict(),
                 }
-            )
-        
-            for atom in structure.atoms:
-                data_atoms.append(
-                    {
-                        "measurement_id": measurement_id,
-                        "temperature": measurement.temperature,
-                        "phase_name": phase_name,
-                        **atom.to_dict(),
-                    }
-                )
-    
-    return pd.DataFrame(data_structures), pd.DataFrame(data_atoms)
+
+
+def _write_csv(filepath: str | Path, rows: Iterable[dict[str, Any]]) -> None:
+    """Write rows to a CSV file without materializing a dataframe.
+
+    Missing values (nan) are written as empty fields, matching DataFrame.to_csv.
+
+    Args:
+        filepath: Path of the file to be written.
+        rows: The rows to be written; the keys of the first row define the header.
+    """
+    def clean(row: dict[str, Any]) -> dict[str, Any]:
+        return {
+            key: "" if isinstance(value, float) and value != value else value
+            for key, value in row.items()
+        }
+
+    rows = iter(rows)
+    first_row = next(rows, None)
+
+    with open(filepath, "w", newline="") as f:
+        if first_row is None:
+            return
+
+        writer = csv.DictWriter(f, fieldnames=list(first_row), lineterminator="\n")
+        writer.writeheader()
+        writer.writerow(clean(first_row))
+        writer.writerows(clean(row) for row in rows)
+
 
 # example call:
 # xrpd-parser -i examples/Beispiel.out -o examples/example_output
@@ -104,19 +335,25 @@ def main() -> None:
     output_directory.mkdir(exist_ok=True, parents=False)
     
     measurements = parse_file(file_path)
+
+    if args.no_plot:
+        # without plots there is no need for dataframes; stream the rows straight to CSV
+        _write_csv(output_directory / "structures.csv", iter_structure_rows(measurements))
+        _write_csv(output_directory / "atoms.csv", iter_atom_rows(measurements))
+        return
+
     df_structures, df_atoms = to_dataframes(measurements)
-    
+
     df_structures.to_csv(output_directory / "structures.csv", index=False)
     df_atoms.to_csv(output_directory / "atoms.csv", index=False)
-    
-    if not args.no_plot:
-        plot_parameters(
-            df_structures,
-            save_as = output_directory / "summary_plots_against_temperature.pdf",
-            against_temperature=True,
-        )
-        plot_parameters(
-            df_structures,
-            save_as = output_directory / "summary_plots_against_measurement.pdf",
-            against_temperature=False,
-        )
+
+    plot_parameters(
+        df_structures,
+        save_as = output_directory / "summary_plots_against_temperature.pdf",
+        against_temperature=True,
+    )
+    plot_parameters(
+        df_structures,
+        save_as = output_directory / "summary_plots_against_measurement.pdf",
+        against_temperature=False,
+    )
@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import re
-from collections import deque
+import sys
 from typing import Any
 
 from xrpd_parser.structure import Structure
-from xrpd_parser.value import Value
+from xrpd_parser.utils import LineCursor
+from xrpd_parser.utils import count_leading_tabs
+from xrpd_parser.value import make_value
 
 
 XDD_REGEX = re.compile(r'xdd "(.+)"')
@@ -16,20 +18,56 @@ TEMPERATURE_REGEX = re.compile(r"_(\d+)-0_C\.xy$")
 class Measurement:
     """Class for measurements."""
     
-    def __init__(self, calling_line: str, line_queue: deque[str]) -> None:
+    def __init__(self, calling_line: str, line_queue: LineCursor) -> None:
         """Constructor of the Measurement class.
 
         Args:
             calling_line: The line containing the 'xdd' call.
-            line_queue: The queue of lines to be parsed.
-        """        
+            line_queue: The cursor over the lines to be parsed.
+        """
+        self.calling_line = calling_line
         self.xy_file_path, self.temperature = self._parse_xdd_call(calling_line)
-        
+
         self.params: dict[str, Any] = {}
         self.structures: dict[str, Structure] = {}
-        
+
         self._parse(line_queue)
-    
+
+    @classmethod
+    def _from_calling_line(cls, calling_line: str, line_queue: LineCursor) -> Measurement:
+        """Create a measurement whose 'xdd' call is decoded later in bulk.
+
+        The structures and parameters are parsed immediately, whereas the .xy file path and the
+        temperature are expected to be filled in afterwards via '_set_from_parsed', e.g., from a
+        vectorized extraction over the calling lines of all measurements in a file.
+
+        Args:
+            calling_line: The line containing the 'xdd' call.
+            line_queue: The cursor over the lines to be parsed.
+
+        Returns:
+            The new measurement instance.
+        """
+        measurement = cls.__new__(cls)
+        measurement.calling_line = calling_line
+        measurement.xy_file_path = ""
+        measurement.temperature = float("nan")
+        measurement.params = {}
+        measurement.structures = {}
+        measurement._parse(line_queue)
+
+        return measurement
+
+    def _set_from_parsed(self, xy_file_path: str, temperature: float) -> None:
+        """Set the .xy file path and temperature that were decoded outside the instance.
+
+        Args:
+            xy_file_path: The path of the .xy file of the measurement.
+            temperature: The temperature in degrees Celsius.
+        """
+        self.xy_file_path = xy_file_path
+        self.temperature = temperature
+
     def _parse_xdd_call(self, calling_line: str) -> tuple[str, float]:
         """Parse the first line of the measurement, i.e., the starting with 'xdd'.
 
@@ -49,38 +87,49 @@ class Measurement:
             raise ValueError(f"Could not parse .xy filename from {calling_line}")
         
         xy_file_path = match.group(1)
-        
-        temperature_match = TEMPERATURE_REGEX.search(xy_file_path)
-        if not temperature_match:
+
+        # the temperature sits in a fixed '_NNNN-0_C.xy' tail, so plain string operations
+        # suffice and avoid entering the regex engine per measurement
+        if xy_file_path.endswith("-0_C.xy"):
+            _, separator, temperature_str = xy_file_path[:-7].rpartition("_")
+        else:
+            separator, temperature_str = "", ""
+
+        if not separator or not temperature_str.isdigit():
             raise ValueError(
                 f"Could not parse temperature from {xy_file_path}, expected filename to end with "
                 "something like '_0024-0_C.xy' (which would return 24.0 for 24 degrees Celcius)"
             )
-        
-        temperature = temperature_match.group(1).lstrip("0")
-        temperature = float(temperature) if temperature else 0.0
-        
-        return xy_file_path, temperature
+
+        return xy_file_path, float(temperature_str)
     
-    def _parse(self, line_queue: deque[str]) -> None:
+    def _parse(self, line_queue: LineCursor) -> None:
         """Parse the lines belonging to the measurement.
-        
+
         The function parses line until a new measurement starts (as defined by indentation) or no
         more lines are in the queue.
 
         Args:
-            line_queue: The queue of lines to be parsed.
-        """        
-        while line_queue and line_queue[0].startswith("\t"):
-            line = line_queue.popleft()
-            
-            if line.startswith("\tstr"):
+            line_queue: The cursor over the lines to be parsed.
+        """
+        while (line := line_queue.peek()) is not None and line[:1] == "\t":
+            line_queue.pop()
+
+            # scan the indentation once and dispatch on the tab count; keywords are then
+            # compared via slicing instead of repeated startswith calls
+            tabs = count_leading_tabs(line)
+            if tabs != 1:
+                continue
+
+            if line[1:4] == "str":
                 structure = Structure(line_queue)
                 self.structures[structure.phase_name] = structure
-            
-            elif line.startswith("\tr_exp"):
+
+            elif line[1:6] == "r_exp":
                 line_split = line.strip().split()
                 for i in range(0, len(line_split), 2):
-                    self.params[line_split[i]] = Value(line_split[i + 1])
-        
+                    # interned keys let later dict lookups with the interned literals succeed
+                    # via pointer identity instead of a character-wise comparison
+                    self.params[sys.intern(line_split[i])] = make_value(line_split[i + 1])
+
             # TODO: parse more measurement parameters
@@ -2,16 +2,18 @@
 from __future__ import annotations
 
 import re
-from collections import deque
-from typing import Any
+from dataclasses import dataclass
 from typing import Iterable
 
 import numpy as np
 
+from xrpd_parser.atom import ATOM_REGEX
 from xrpd_parser.atom import Atom
 from xrpd_parser.utils import DuplicatedParameterError
+from xrpd_parser.utils import LineCursor
 from xrpd_parser.utils import MissingInformationError
 from xrpd_parser.value import Value
+from xrpd_parser.value import make_value
 
 
 PHASE_NAME_REGEX = re.compile(r'^phase_name "(.*)"$')
@@ -22,11 +24,49 @@ MVW_REGEX = re.compile(r"^MVW\((.*),(.*),(.*)\)$")
 # example: Hexagonal(@  6.810339`_0.001012,@  4.149473`_0.001189)
 PARAM_WITH_PARENTHESES_REGEX = re.compile(r"^([a-zA-Z]+)\((.*)\)$")
 
+# cheaper to load than the 'np.nan' attribute in the to_dict hot path
+_NAN = float("nan")
+
+
+@dataclass(slots=True)
+class StructureParams:
+    """Record of the parameters of a structure with values and errors as plain floats.
+
+    Every numeric parameter has a paired '{parameter}_err' field; parameters that were not set
+    during parsing keep their nan defaults.
+    """
+
+    crystal_system: str = ""
+    r_bragg: float = _NAN
+    r_bragg_err: float = _NAN
+    phase_MAC: float = _NAN
+    phase_MAC_err: float = _NAN
+    scale: float = _NAN
+    scale_err: float = _NAN
+    a: float = _NAN
+    a_err: float = _NAN
+    b: float = _NAN
+    b_err: float = _NAN
+    c: float = _NAN
+    c_err: float = _NAN
+    al: float = _NAN
+    al_err: float = _NAN
+    be: float = _NAN
+    be_err: float = _NAN
+    ga: float = _NAN
+    ga_err: float = _NAN
+    molar_mass: float = _NAN
+    molar_mass_err: float = _NAN
+    cell_volume: float = _NAN
+    cell_volume_err: float = _NAN
+    mass_fraction: float = _NAN
+    mass_fraction_err: float = _NAN
+
 
 class Structure:
     """Class for measured structures."""
     
-    NUMERICAL_PARAMS = {
+    NUMERICAL_PARAMS = frozenset({
         "r_bragg",
         "phase_MAC",
         "scale",
@@ -36,7 +76,7 @@ class Structure:
         "al",
         "be",
         "ga",
-    }
+    })
     
     CRYSTAL_SYSTEMS = {
         "Triclinic": ("a", "b", "c", "al", "be", "ga",),
@@ -66,17 +106,22 @@ class Structure:
         "molar_mass": True,
         "cell_volume": True,
         "mass_fraction": True,
-    } 
-    
-    def __init__(self, line_queue: deque[str]) -> None:
+    }
+
+    # precomputed (parameter, has_error) pairs so that to_dict does not have to probe
+    # PARAM2HAS_ERROR per parameter on every call
+    _DICT_SCHEMA = tuple(PARAM2HAS_ERROR.items())
+
+    def __init__(self, line_queue: LineCursor) -> None:
         """Constructor of the Structure class.
 
         Args:
-            line_queue: The queue of lines to be parsed.
+            line_queue: The cursor over the lines to be parsed.
         """
         self.phase_name: str = ""
-        self.params: dict[str, Any] = {}
+        self.params = StructureParams()
         self.atoms: list[Atom] = []
+        self._set_parameters: set[str] = set()
         self._parse(line_queue)
     
     def to_dict(
@@ -95,21 +140,39 @@ class Structure:
         Returns:
             A dictionary representation of the structure.
         """
-        result = {}
-        
         if parameters is None:
-            parameters = self.PARAM2HAS_ERROR.keys()
-        
-        for p in parameters:
-            result[p] = self.params[p].value if p in self.params else np.nan
-            
-            if self.PARAM2HAS_ERROR.get(p):
-                result[f"{p}_err"] = self.params[p].error if p in self.params else np.nan
-        
+            schema = self._DICT_SCHEMA
+        else:
+            schema = tuple((p, bool(self.PARAM2HAS_ERROR.get(p))) for p in parameters)
+
+        params = self.params
+        result = {}
+
+        for p, has_error in schema:
+            result[p] = getattr(params, p, _NAN)
+
+            if has_error:
+                result[f"{p}_err"] = getattr(params, f"{p}_err", _NAN)
+
         return result
     
+    def fill_row(self, row: np.ndarray, param_indices: dict[str, int]) -> None:
+        """Write the numeric parameters of the structure into a preallocated matrix row.
+
+        Args:
+            row: One float row of a matrix with one column per requested parameter.
+            param_indices: Mapping from parameter (or '{parameter}_err') name to column index.
+        """
+        params = self.params
+
+        for p, i in param_indices.items():
+            row[i] = getattr(params, p, _NAN)
+
     def _set_parameter(self, parameter_name: str, value: str | Value):
-        """Set a parameter.
+        """Set a parameter on the params record.
+
+        Values are expanded into plain floats at set-time, i.e., the value itself and its error
+        are written to the '{parameter_name}' and '{parameter_name}_err' fields.
 
         Args:
             parameter_name: Name of the parameter.
@@ -117,11 +180,17 @@ class Structure:
 
         Raises:
             DuplicatedParameterError: If the parameter has already been set.
-        """        
-        if parameter_name in self.params:
+        """
+        if parameter_name in self._set_parameters:
             raise DuplicatedParameterError(parameter_name)
-        
-        self.params[parameter_name] = value
+
+        self._set_parameters.add(parameter_name)
+
+        if isinstance(value, Value):
+            setattr(self.params, parameter_name, value.value)
+            setattr(self.params, f"{parameter_name}_err", value.error)
+        else:
+            setattr(self.params, parameter_name, value)
 
     def _parse_crystal_system(self, crystal_system: str, values_str: str) -> None:
         """Set the crystal system and the corresponding values.
@@ -150,63 +219,139 @@ class Structure:
         
         for value_str, parameters in zip(values, self.CRYSTAL_SYSTEMS[crystal_system]):
             for p in parameters.split("="):
-                self._set_parameter(p, Value(value_str))
+                self._set_parameter(p, make_value(value_str))
         
-    def _parse(self, line_queue: deque[str]) -> None:
+    def _handle_phase_name(self, line: str, head: str, tail: str) -> None:
+        """Parse a 'phase_name' line.
+
+        The fixed prefix and suffix make slicing sufficient; the compiled regex remains as a
+        fallback for deviating lines.
+
+        Args:
+            line: The stripped line to be parsed.
+            head: The first whitespace-delimited token of the line.
+            tail: The remainder of the line after the first token (stripped).
+        """
+        if line[:12] == 'phase_name "' and line[-1] == '"':
+            self.phase_name = line[12:-1]
+            return
+
+        match = PHASE_NAME_REGEX.match(line)
+        if match:
+            self.phase_name = match.group(1)
+
+    def _handle_site(self, line: str, head: str, tail: str) -> None:
+        """Collect a 'site' line for the batched atom parsing after the parse loop.
+
+        Args:
+            line: The stripped line to be parsed.
+            head: The first whitespace-delimited token of the line.
+            tail: The remainder of the line after the first token (stripped).
+        """
+        self._site_lines.append(line)
+
+    def _handle_numerical_param(self, line: str, head: str, tail: str) -> None:
+        """Parse a numerical parameter line, e.g., 'r_bragg 2.345'.
+
+        Args:
+            line: The stripped line to be parsed.
+            head: The first whitespace-delimited token of the line, i.e., the parameter name.
+            tail: The remainder of the line after the first token (stripped), i.e., the value.
+
+        Raises:
+            ValueError: If the parameter has no value.
+        """
+        if not tail:
+            raise ValueError(f"found parameter {head} without value")
+
+        self._set_parameter(head, make_value(tail))
+
+    # dispatch table keyed on the first whitespace-delimited token of a line, so that one hash
+    # lookup replaces the sequential prefix checks per line
+    _LINE_HANDLERS = {
+        "phase_name": _handle_phase_name,
+        "site": _handle_site,
+    }
+    for _p in NUMERICAL_PARAMS:
+        _LINE_HANDLERS[_p] = _handle_numerical_param
+    del _p
+
+    def _parse(self, line_queue: LineCursor) -> None:
         """Parse the lines belonging to the structure.
-        
+
         The function parses line until a new measurement starts (as defined by indentation) or no
         more lines are in the queue.
 
         Args:
-            line_queue: The queue of lines to be parsed.
+            line_queue: The cursor over the lines to be parsed.
         """
-        while line_queue and line_queue[0].startswith("\t\t"):
-            line = line_queue.popleft().strip()
-            
-            # phase name
-            match = PHASE_NAME_REGEX.match(line)
-            if match:
-                self.phase_name = match.group(1)
+        self._site_lines: list[str] = []
+
+        # bind the per-line lookups to locals; the loop body is pure interpreter work, so
+        # avoiding the repeated attribute loads is a measurable share of its cost
+        peek = line_queue.peek
+        pop = line_queue.pop
+        get_handler = self._LINE_HANDLERS.get
+
+        # the slice comparison is a single C-level equality check per line, cheaper than a
+        # Python-level helper call for the fixed two-tab indentation
+        while (line := peek()) is not None and line[:2] == "\t\t":
+            pop()
+            line = line.strip()
+
+            if not line:
                 continue
-            
-            # molar mass, cell volume, mass fraction
-            match = MVW_REGEX.match(line)
-            if match:
-                self._set_parameter("molar_mass", Value(match.group(1).strip()))
-                self._set_parameter("cell_volume", Value(match.group(2).strip()))
-                self._set_parameter("mass_fraction", Value(match.group(3).strip()))
+
+            # split on any whitespace (tokens may be tab-delimited), at most once per line
+            head_tail = line.split(maxsplit=1)
+            head = head_tail[0]
+            tail = head_tail[1] if len(head_tail) == 2 else ""
+
+            handler = get_handler(head)
+            if handler is not None:
+                handler(self, line, head, tail)
                 continue
-            
+
+            # molar mass, cell volume, mass fraction (the head contains the opening parenthesis,
+            # so these lines are not covered by the dispatch table)
+            if line[:4] == "MVW(":
+                if line[-1] == ")":
+                    mvw_values = line[4:-1].split(",")
+                    if len(mvw_values) == 3:
+                        self._set_parameter("molar_mass", make_value(mvw_values[0].strip()))
+                        self._set_parameter("cell_volume", make_value(mvw_values[1].strip()))
+                        self._set_parameter("mass_fraction", make_value(mvw_values[2].strip()))
+                        continue
+                match = MVW_REGEX.match(line)
+                if match:
+                    self._set_parameter("molar_mass", make_value(match.group(1).strip()))
+                    self._set_parameter("cell_volume", make_value(match.group(2).strip()))
+                    self._set_parameter("mass_fraction", make_value(match.group(3).strip()))
+                    continue
+
             # parameters with values in parentheses
             match = PARAM_WITH_PARENTHESES_REGEX.match(line)
             if match:
                 if match.group(1) in self.CRYSTAL_SYSTEMS:
                     self._parse_crystal_system(match.group(1), match.group(2))
                 continue
-            
-            # atoms
-            if line.startswith("site"):
-                self.atoms.append(Atom(line))
-                continue
-                
-            # additional parameters
-            
-            line_split = line.split(maxsplit=1)
-            
-            if not line_split:
-                continue
-            
-            if line_split[0] in self.NUMERICAL_PARAMS:
-                if len(line_split) < 2:
-                    raise ValueError(f"found parameter {line_split[0]} without value")
-                
-                param, value_str = line_split
-                self._set_parameter(param, Value(value_str))
-        
+
+        site_lines = self._site_lines
+        del self._site_lines
+
+        if site_lines:
+            # a single finditer pass over all site lines amortizes the per-call overhead of the
+            # regex engine; if it does not account for every line (e.g. values with whitespace),
+            # fall back to parsing the lines individually
+            matches = list(ATOM_REGEX.finditer("\n".join(site_lines)))
+            if len(matches) == len(site_lines):
+                self.atoms = [Atom._from_match(match) for match in matches]
+            else:
+                self.atoms = [Atom(site_line) for site_line in site_lines]
+
         if not self.phase_name:
             raise MissingInformationError("phase_name")
         
         for p in self.REQUIRED_PARAMS:
-            if p not in self.params:
+            if p not in self._set_parameters:
                 raise MissingInformationError(p)
@@ -1,6 +1,64 @@
 """Module to define utils functions and classes."""
 from __future__ import annotations
 
+from typing import Iterable
+
+
+class LineCursor:
+    """A forward-only cursor over an iterable of lines with one-line lookahead.
+
+    The cursor pulls lines lazily, so a file can be parsed while it is being read without
+    keeping all of its lines in memory at once.
+    """
+
+    __slots__ = ("_lines", "_peeked")
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        """Constructor of the LineCursor.
+
+        Args:
+            lines: The lines to be walked, e.g., an open file object.
+        """
+        self._lines = iter(lines)
+        self._peeked: str | None = None
+
+    def peek(self) -> str | None:
+        """Return the next line without consuming it.
+
+        Returns:
+            The next line, or None if all lines have been consumed.
+        """
+        if self._peeked is None:
+            self._peeked = next(self._lines, None)
+        return self._peeked
+
+    def pop(self) -> str | None:
+        """Return the next line and advance the cursor.
+
+        Returns:
+            The next line, or None if all lines have been consumed.
+        """
+        line = self.peek()
+        self._peeked = None
+        return line
+
+
+def count_leading_tabs(line: str) -> int:
+    """Count the number of leading tab characters of a line.
+
+    Args:
+        line: The line to be inspected.
+
+    Returns:
+        The number of leading tabs.
+    """
+    i = 0
+    n = len(line)
+    while i < n and line[i] == "\t":
+        i += 1
+
+    return i
+
 
 class ParsingError(Exception):
     """Exception raises when the parsing failed."""
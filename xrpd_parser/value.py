@@ -1,48 +1,114 @@
 """Module defining a class for measured or fixed values and their errors."""
 from __future__ import annotations
 
+import functools
 import re
 
 from xrpd_parser.utils import ParsingError
 
 
 # example: 4.02901455e-007
-NUMERIC_REGEX = r"([+-]?([0-9]*[.])?[0-9]+(e[+-]\d+)?)"
+NUMERIC_REGEX = r"[+-]?(?:[0-9]*[.])?[0-9]+(?:e[+-]\d+)?"
 
+# both accepted forms fused into one pattern so that a single match call handles either
 # example: @  4.02901455e-007`_6.025e-008_LIMIT_MIN_1e-015
+# example: "=1/3; :  0.33333"
 VALUE_REGEX = re.compile(
-    r"^(@\s+)?"                     # has been fitted?
-    + NUMERIC_REGEX +               # value
-    r"(`_" + NUMERIC_REGEX + r")?"  # error 
-    r"([\s_](.*))?$",               # additional parameters/restrictions
+    r"^(?:"
+    r"(?P<fitted>@\s+)?"                     # has been fitted?
+    r"(?P<value>" + NUMERIC_REGEX + r")"     # value
+    r"(?:`_(?P<error>" + NUMERIC_REGEX +     # error
+    r"))?"
+    r"(?:[\s_](?P<parameters>.*))?"          # additional parameters/restrictions
+    r"|"
+    r"=(?P<numerator>\d+)\/(?P<denominator>[1-9]\d*)"   # fraction
+    r";\s*:\s*(?P<approximation>(?:[0-9]*[.])?[0-9]+)"  # decimal approximation
+    r")$",
 )
 
-# example: "=1/3; :  0.33333"
-FRACTION_REGEX = re.compile(r"^=(\d+)\/([1-9]\d*);\s*:\s*(([0-9]*[.])?[0-9]+)$")
-
 
 class Value:
-    """A class for measured or fixed values and their errors."""
-    
+    """A class for measured or fixed values and their errors.
+
+    The raw string is stored at construction and only parsed when one of the attributes is read
+    for the first time, so values that are never accessed never pay for the parse.
+    """
+
+    __slots__ = ("_raw", "_parsed", "_value", "_error", "_has_been_fitted", "_parameters", "_repr")
+
     def __init__(self, value_str) -> None:
         """Constructor of the Value class.
 
         Args:
-            value_str: The string to be parsed.
+            value_str: The string to be parsed (lazily, on first attribute access).
         """
-        self._parse(value_str)
-    
-    
+        self._raw = value_str
+        self._parsed = False
+        self._repr = None
+
+    @property
+    def value(self) -> float:
+        """The value itself.
+
+        Raises:
+            ParsingError: If the parsing was not successful.
+        """
+        if not self._parsed:
+            self._parse(self._raw)
+        return self._value
+
+    @property
+    def error(self) -> float:
+        """The error of the value (0.0 if it does not have one).
+
+        Raises:
+            ParsingError: If the parsing was not successful.
+        """
+        if not self._parsed:
+            self._parse(self._raw)
+        return self._error
+
+    @property
+    def has_been_fitted(self) -> bool:
+        """Whether the value has been fitted (marked with '@').
+
+        Raises:
+            ParsingError: If the parsing was not successful.
+        """
+        if not self._parsed:
+            self._parse(self._raw)
+        return self._has_been_fitted
+
+    @property
+    def parameters(self) -> str | None:
+        """The additional parameters/restrictions of the value, if any.
+
+        Raises:
+            ParsingError: If the parsing was not successful.
+        """
+        if not self._parsed:
+            self._parse(self._raw)
+        return self._parameters
+
+
     def __str__(self) -> str:
         """Return a string representation of the value.
 
+        The representation is built on the first call and cached, since the instance is
+        immutable once parsed.
+
         Returns:
             A string representation of the value.
         """
-        fitted = "fitted" if self.has_been_fitted else "not fitted"
-        param = f", Param: {self.parameters}" if self.parameters else ""
-        
-        return f"Value({self.value} +/- {self.error}, {fitted}{param})"
+        result = self._repr
+
+        if result is None:
+            fitted = "fitted" if self.has_been_fitted else "not fitted"
+            param = f", Param: {self.parameters}" if self.parameters else ""
+
+            result = self._repr = f"Value({self.value} +/- {self.error}, {fitted}{param})"
+
+        return result
     
     def __repr__(self) -> str:
         """Return a string representation of the value.
@@ -62,24 +128,60 @@ class Value:
             ParsingError: If the parsing was not successful.
         """
         value_str = value_str.strip()
-        
+
+        # fast path: most value strings are plain numbers without fit markers, errors, or
+        # restrictions, and float() handles those without entering the regex engine
+        if (
+            "@" not in value_str
+            and "`" not in value_str
+            and "_" not in value_str
+            and "=" not in value_str
+        ):
+            try:
+                value = float(value_str)
+            except ValueError:
+                pass
+            else:
+                self._value = value
+                self._error = 0.0
+                self._has_been_fitted = False
+                self._parameters = None
+                self._parsed = True
+                return
+
         match = VALUE_REGEX.match(value_str)
-        
-        if match:
-            self.value = float(match.group(2))
-            self.error = float(match.group(6)) if match.group(6) else 0.0
-            self.has_been_fitted = bool(match.group(1))
+
+        if not match:
+            raise ParsingError(value_str, message="could not parse value")
+
+        if match.group("value") is not None:
+            error = match.group("error")
+            self._value = float(match.group("value"))
+            self._error = float(error) if error else 0.0
+            self._has_been_fitted = bool(match.group("fitted"))
             # TODO: parse the additional parameters, e.g., limits that were set
-            self.parameters = match.group(8)
-            return
-
-        match = FRACTION_REGEX.match(value_str)
-        
-        if match:
-            self.value = float(match.group(1)) / float(match.group(2))
-            self.error = 0.0
-            self.has_been_fitted = False
-            self.parameters = match.group(3)
-            return
-        
-        raise ParsingError(value_str, message="could not parse value")
+            self._parameters = match.group("parameters")
+        else:
+            self._value = float(match.group("numerator")) / float(match.group("denominator"))
+            self._error = 0.0
+            self._has_been_fitted = False
+            self._parameters = match.group("approximation")
+
+        self._parsed = True
+
+
+@functools.lru_cache(maxsize=4096)
+def make_value(value_str: str) -> Value:
+    """Return a (possibly cached) value for the given string.
+
+    Many value strings repeat across the atoms and structures of a file, e.g., fixed occupancies
+    or symmetry-fixed coordinates; identical strings share a single parsed instance. Callers must
+    therefore treat the returned values as immutable.
+
+    Args:
+        value_str: The string to be parsed.
+
+    Returns:
+        The parsed value.
+    """
+    return Value(value_str)